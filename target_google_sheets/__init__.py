@@ -1 +1 @@
-from .main import main
+from .main import GoogleSheetsSink, main
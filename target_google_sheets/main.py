@@ -1,17 +1,28 @@
+import io
 import json
 import logging
+import queue
+import random
 import sys
+import threading
+import time
 import types
-import typing
 from argparse import ArgumentParser
 from collections import defaultdict
-from io import TextIOWrapper
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
+import fastjsonschema
 import gspread
-import jsonschema
+import orjson
 import singer
+from google.auth.transport.requests import AuthorizedSession
+from google.oauth2.service_account import Credentials
+from gspread.urls import SPREADSHEET_BATCH_UPDATE_URL, SPREADSHEET_VALUES_APPEND_URL
+from gspread.utils import absolute_range_name, quote
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .exceptions import MessageNotRecognized, OverflowedSink, SchemaNotFound
 from .models import SingerData, SinkConfig, TargetGoogleSheetConfig
@@ -19,14 +30,33 @@ from .utils import DEFAULT_CREDENTIALS_PATH, get_credentials
 
 logging.getLogger("gspread").setLevel(logging.WARNING)
 
-#: Default size for worksheet creation
-WORKSHEET_DEFAULT_ROWS, WORKSHEET_DEFAULT_COLS = 100, 20
+#: Default size for worksheet creation, appends grow the grid past it
+WORKSHEET_DEFAULT_ROWS, WORKSHEET_DEFAULT_COLS = 1000, 20
 
 #: Sink Settings (in rows)
 DEFAULT_SINK_SIZE = 250
 SINK_LIMIT_INCREMENT = 250
 MAX_SINK_LIMIT = 2000
 
+#: Number of RECORD messages buffered per stream before being added to the sink
+RECORD_BATCH_SIZE = 64
+
+#: Number of drained batches waiting to be appended before `drain` blocks
+DRAIN_QUEUE_SIZE = 4
+
+#: Read size (in bytes) for buffering stdin
+STDIN_BUFFER_SIZE = 1 << 20
+
+#: JSON Schema draft assumed for SCHEMA messages without a `$schema` (Singer's draft)
+DEFAULT_JSON_SCHEMA = "http://json-schema.org/draft-04/schema#"
+
+#: Connection pool settings for the shared HTTP session
+HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE = 4, 8
+
+#: Backoff Settings (in seconds) for 429 responses
+BACKOFF_RETRIES = 5
+BACKOFF_BASE, BACKOFF_CAP, BACKOFF_JITTER = 1.0, 64.0, 1.0
+
 
 class GoogleSheetsSink:
     """A RECORD row sink to hold batches of rows before sending to google sheets
@@ -35,10 +65,19 @@ class GoogleSheetsSink:
       Gspread API request. This allows us to make significantly less requests
       making the singer target more efficient, and less taxing on API limits.
 
-    If a request fails, the sink increases it's size by a set increment, if requests
+    If a request hits the API quota, the sink waits for `Retry-After` (or an exponential
+      backoff) and retries the same batch. If the quota pressure persists after
+      BACKOFF_RETRIES, the sink increases it's size by a set increment, if requests
       continue to fail, the max sink limit will be reached causing an overflow exception.
 
     Each stream will have it's own "sink" so this class acts as a collection of sinks.
+      A sink is stored column-major, one list of values per column, and only
+      transposed into rows when it's drained.
+
+    Drained rows are handed to a background thread through a bounded queue, so
+      stdin keeps being parsed while the appends are in flight. Errors from the
+      thread are re-raised on the next `drain` / `drain_all`. Call `close` to
+      stop the thread once the target is done.
 
     Constants:
       - DEFAULT_SINK_SIZE: Default size of sink
@@ -46,90 +85,397 @@ class GoogleSheetsSink:
       - MAX_SINK_LIMIT: Max size of sink before overflowing
     """
 
-    sinks: defaultdict[str, list[list]]
-    limit: defaultdict[str, int]
-    worksheets: dict[str, gspread.Spreadsheet]
+    __slots__ = (
+        "config",
+        "sinks",
+        "count",
+        "limit",
+        "spreadsheet",
+        "worksheets",
+        "columns",
+        "unknown_keys",
+        "next_allowed_ts",
+        "sheets_by_title",
+        "session",
+        "queue",
+        "error",
+        "thread",
+    )
+
+    sinks: dict[str, list[list]]
+    count: dict[str, int]
+    limit: dict[str, int]
+    worksheets: dict[str, gspread.Worksheet]
+    columns: dict[str, tuple[str, ...]]
+    unknown_keys: dict[str, set[str]]
+    next_allowed_ts: dict[str, float]
+    sheets_by_title: dict[str, gspread.Worksheet]
+    queue: queue.Queue
+    error: Exception | None
 
     def __init__(self, sink_config: SinkConfig, spreadsheet: gspread.Spreadsheet):
         self.config = sink_config
-        self.sinks = defaultdict(list)
-        self.limit = defaultdict(lambda: sink_config["default_sink_size"])
+        self.sinks = {}
+        self.count = {}
+        self.limit = {}
         self.spreadsheet = spreadsheet
         self.worksheets = {}
-
-    def get_or_create_sheet(self, name: str, record: dict):
+        self.columns = {}
+        self.unknown_keys = {}
+        self.next_allowed_ts = {}
+        self.sheets_by_title = {ws.title: ws for ws in spreadsheet.worksheets()}
+        self.session = spreadsheet.client.session
+
+        self.queue = queue.Queue(maxsize=DRAIN_QUEUE_SIZE)
+        self.error = None
+        self.thread = threading.Thread(target=self.consume, daemon=True)
+        self.thread.start()
+
+    def get_or_create_sheet(self, name: str, columns: tuple[str, ...]):
         """Retrieves a sheet from the gspread API
 
+        Sheets are looked up from the worksheets fetched when the sink was created.
         If a sheet name is not found, then the method will produce a new sheet.
-        It will also prefil the first row with column information curated from a
-          singer record/row.
+        It will also prefil the first row with the stream's column names.
         """
 
         name = name.replace(":", "_")
 
-        try:
-            return self.spreadsheet.worksheet(name)
+        if name in self.sheets_by_title:
+            return self.sheets_by_title[name]
 
-        except gspread.WorksheetNotFound:
-            singer.log_info(f"Creating new worksheet: {name}")
-            spreadsheet = self.spreadsheet.add_worksheet(
-                title=name, rows=WORKSHEET_DEFAULT_ROWS, cols=WORKSHEET_DEFAULT_COLS
-            )
-            spreadsheet.append_row(list(record.keys()), value_input_option="RAW")
-            return spreadsheet
+        singer.log_info(f"Creating new worksheet: {name}")
+        worksheet = self.create_sheet(name, columns)
+        self.sheets_by_title[name] = worksheet
+
+        return worksheet
 
-    def add(self, stream: str, record: dict):
-        """Add a record to the sink for a specific singer stream
+    def create_sheet(self, name: str, columns: tuple[str, ...]) -> gspread.Worksheet:
+        """Creates a pre-sized sheet with a header row in a single batchUpdate
 
-        Checks if the stream's sink is overflowed and drains it if so.
+        The sheet id is picked up front so the header can be written in the same
+          request. The grid starts at a fixed WORKSHEET_DEFAULT_ROWS, which keeps
+          new tabs small against the spreadsheet's cell limit.
+        """
+
+        taken = {ws.id for ws in self.sheets_by_title.values()}
+        sheet_id = random.randrange(1, 2**31)
+
+        while sheet_id in taken:
+            sheet_id = random.randrange(1, 2**31)
+
+        rows = WORKSHEET_DEFAULT_ROWS
+        cols = max(len(columns), WORKSHEET_DEFAULT_COLS)
+
+        body = {
+            "requests": [
+                {
+                    "addSheet": {
+                        "properties": {
+                            "sheetId": sheet_id,
+                            "title": name,
+                            "gridProperties": {"rowCount": rows, "columnCount": cols},
+                        }
+                    }
+                },
+                {
+                    "updateCells": {
+                        "start": {"sheetId": sheet_id, "rowIndex": 0, "columnIndex": 0},
+                        "rows": [{"values": [cell_data(column) for column in columns]}],
+                        "fields": "userEnteredValue",
+                    }
+                },
+            ]
+        }
+
+        response = self.spreadsheet.batch_update(body)
+        properties = response["replies"][0]["addSheet"]["properties"]
+
+        return gspread.Worksheet(self.spreadsheet, properties)
+
+    def add(self, stream: str, record: dict, schema: dict | None = None) -> bool:
+        """Add a record to the sink for a specific singer stream"""
+
+        return self.add_many(stream, [record], schema)
+
+    def add_many(
+        self, stream: str, records: list[dict], schema: dict | None = None
+    ) -> bool:
+        """Add a batch of records to the sink for a specific singer stream
+
+        The columns of a stream are fixed when it's first seen, from the (flattened)
+          properties of its schema, or the first record's keys if the schema has
+          none. Keys outside those columns can't be written and are warned about,
+          unless their value is None.
+        Values are coerced to their wire form here, once, see `SCALAR_TYPES`.
+        Checks if the stream's sink is overflowed and drains it if so, once for the
+          whole batch. Returns whether the sink was drained.
         """
-        self.sinks[stream].append(list(record.values()))
 
         if stream not in self.worksheets:
-            self.worksheets[stream] = self.get_or_create_sheet(stream, record)
+            columns = flatten_schema(schema or {})[0] or tuple(records[0].keys())
+            self.columns[stream] = columns
+            self.unknown_keys[stream] = set()
+            self.worksheets[stream] = self.get_or_create_sheet(stream, columns)
+            self.sinks[stream] = [[] for _ in columns]
+            self.count[stream] = 0
+
+        columns = self.columns[stream]
+        known = set(columns)
+        buffers = tuple(zip(self.sinks[stream], columns))
+
+        for record in records:
+            if not record.keys() <= known:
+                self.warn_unknown_keys(
+                    stream, {k for k in record.keys() - known if record[k] is not None}
+                )
 
-        self.check(stream)
+            for buffer, column in buffers:
+                value = record.get(column)
 
-    def check(self, stream):
-        """Drains sink after checking for overflow"""
+                if type(value) in SCALAR_TYPES:
+                    buffer.append(value)
+                else:
+                    buffer.append("" if value is None else json_string(value))
 
-        if len(self.sinks[stream]) > self.limit[stream]:
+        self.count[stream] += len(records)
+        return self.check(stream)
+
+    def warn_unknown_keys(self, stream: str, keys: set[str]):
+        """Warns (once per key) about record keys which have no column"""
+
+        unknown = keys - self.unknown_keys[stream]
+
+        if unknown:
+            singer.log_warning(
+                f"Dropping keys of stream {stream} not in its columns: {sorted(unknown)}"
+            )
+            self.unknown_keys[stream] |= unknown
+
+    def rows(self, stream: str) -> list[list]:
+        """Transposes a stream's column buffers into rows for the API"""
+
+        return list(map(list, zip(*self.sinks[stream])))
+
+    def clear(self, stream: str):
+        """Empties a stream's column buffers in place"""
+
+        for buffer in self.sinks[stream]:
+            buffer.clear()
+
+        self.count[stream] = 0
+
+    def check(self, stream) -> bool:
+        """Drains sink after checking for overflow, returns whether it drained"""
+
+        limit = self.limit.get(stream, self.config["default_sink_size"])
+
+        if self.count[stream] > limit:
             self.drain(stream)
+            return True
+
+        return False
+
+    def send(self, streams: list[str], request: Callable[[], object]) -> bool:
+        """Sends a request for some streams, backing off while the API quota is hit
+
+        Waits until every stream is allowed to send again before each attempt. On a
+          429, the delay comes from `Retry-After` or an exponential backoff with
+          jitter. Returns False if the quota is still hit after BACKOFF_RETRIES.
+        """
+
+        for attempt in range(BACKOFF_RETRIES):
+            allowed_ts = max(self.next_allowed_ts.get(s, 0.0) for s in streams)
+            time.sleep(max(0.0, allowed_ts - time.monotonic()))
+
+            try:
+                request()
+                return True
+
+            except gspread.exceptions.APIError as err:
+                if not err.response.status_code == 429:
+                    raise err
+
+                delay = retry_after(err, attempt)
+                singer.log_warning(
+                    f"Google Sheets API Quota reached. Retrying in {delay:.1f}s.."
+                )
+
+                for stream in streams:
+                    self.next_allowed_ts[stream] = time.monotonic() + delay
+
+        return False
 
     def drain(self, stream: str):
-        sink = self.sinks[stream]
+        """Queues the rows of a sink to be appended by the background thread"""
 
-        try:
-            sheet = self.worksheets[stream]
-            sheet.append_rows(sink, value_input_option="RAW")
-            singer.log_info(f"Sink limit hit, draining {len(sink)} rows")
-            self.sinks[stream] = []
+        self.raise_error()
 
-        except gspread.exceptions.APIError as err:
-            if not err.response.status_code == 429:
-                raise err
+        singer.log_info(f"Sink limit hit, draining {self.count[stream]} rows")
+        self.queue.put((stream, self.rows(stream)))
+        self.clear(stream)
 
-            if self.limit[stream] > self.config["max_sink_limit"]:
-                raise OverflowedSink(f"Max sink size of {self.limit[stream]} reached.")
+    def post(self, url: str, payload: bytes, params: dict | None = None):
+        """POSTs an already serialized JSON payload with the client's session
+
+        Skips gspread's request building, raising the same `APIError` on failure.
+        """
+
+        response = self.session.post(
+            url,
+            params=params,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+            timeout=self.spreadsheet.client.timeout,
+        )
+
+        if not response.ok:
+            raise gspread.exceptions.APIError(response)
+
+        return response
+
+    def append(self, stream: str, rows: list[list]):
+        """Appends rows to a stream's worksheet, run by the background thread
+
+        Calls the `values.append` endpoint directly with an orjson body. While the
+          quota keeps being hit, the sink's limit grows so that later batches make
+          less requests.
+        """
+
+        range_label = quote(absolute_range_name(self.worksheets[stream].title))
+        url = SPREADSHEET_VALUES_APPEND_URL % (self.spreadsheet.id, range_label)
+        payload = orjson.dumps({"values": rows})
+
+        def request():
+            self.post(url, payload, params={"valueInputOption": "RAW"})
+
+        while not self.send([stream], request):
+            limit = self.limit.get(stream, self.config["default_sink_size"])
+
+            if limit > self.config["max_sink_limit"]:
+                raise OverflowedSink(f"Max sink size of {limit} reached.")
 
             singer.log_warning(
-                f"Google Sheets API Quote reached. Increasing size of sink {stream} temporarily.."
+                f"Google Sheets API Quota still reached. Increasing size of sink {stream} temporarily.."
             )
-            self.limit[stream] += self.config["sink_limit_increment"]
+            self.limit[stream] = limit + self.config["sink_limit_increment"]
+
+    def consume(self):
+        """Background thread loop, appends queued rows until `close` is called"""
+
+        while True:
+            item = self.queue.get()
+
+            try:
+                if item is None:
+                    return
+
+                if self.error is None:
+                    self.append(*item)
+
+            except Exception as err:
+                self.error = err
+
+            finally:
+                self.queue.task_done()
+
+    def raise_error(self):
+        """Re-raises an error which occured in the background thread"""
+
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        """Stops the background thread after the queued rows are appended"""
+
+        self.queue.put(None)
+        self.thread.join()
+        self.raise_error()
 
     def drain_all(self):
-        """Drains all sinks (that have rows)
+        """Drains all sinks (that have rows) in a single batchUpdate request
 
-        Generally used after winding down the target.
+        Each non-empty sink becomes an `appendCells` request on its worksheet, so
+          winding down the target costs one API call rather than one per stream.
+        Waits for rows queued by `drain` first, keeping the rows in order.
         """
 
-        for stream, sink in self.sinks.items():
-            if sink:
-                self.drain(stream)
+        self.queue.join()
+        self.raise_error()
+
+        streams = [stream for stream, count in self.count.items() if count]
+
+        if streams:
+            requests = [
+                {
+                    "appendCells": {
+                        "sheetId": self.worksheets[stream].id,
+                        "rows": [
+                            {"values": [cell_data(value) for value in row]}
+                            for row in self.rows(stream)
+                        ],
+                        "fields": "userEnteredValue",
+                    }
+                }
+                for stream in streams
+            ]
+            url = SPREADSHEET_BATCH_UPDATE_URL % self.spreadsheet.id
+            payload = orjson.dumps({"requests": requests})
+
+            if not self.send(streams, lambda: self.post(url, payload)):
+                raise OverflowedSink(
+                    f"Google Sheets API Quota reached, failed to drain: {streams}"
+                )
+
+            for stream in streams:
+                singer.log_info(f"Draining {self.count[stream]} rows of {stream}")
+                self.clear(stream)
 
         singer.log_info("All sinks drained!")
 
 
+def retry_after(err: gspread.exceptions.APIError, attempt: int) -> float:
+    """Seconds to wait after a 429, from `Retry-After` or an exponential backoff"""
+
+    try:
+        return float(err.response.headers["Retry-After"])
+
+    except (KeyError, ValueError):
+        backoff = min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt)
+        return backoff + random.random() * BACKOFF_JITTER
+
+
+def json_string(value) -> str:
+    """Serializes a non-scalar value (like a JSON array) into a single cell"""
+
+    return orjson.dumps(value).decode()
+
+
+#: RECORD value types sent to Google Sheets as they are, None becomes an empty
+#:   cell and other types are serialized with `json_string`
+SCALAR_TYPES = frozenset({bool, int, float, str})
+
+
+def cell_data(value) -> dict:
+    """Builds the Sheets API `CellData` for a value, mirroring RAW input"""
+
+    match value:
+        case None | "":
+            return {}
+
+        case bool():
+            return {"userEnteredValue": {"boolValue": value}}
+
+        case int() | float():
+            return {"userEnteredValue": {"numberValue": value}}
+
+        case str():
+            return {"userEnteredValue": {"stringValue": value}}
+
+        case _:
+            return {"userEnteredValue": {"stringValue": str(value)}}
+
+
 def parser():
     arg_parser = ArgumentParser()
     arg_parser.add_argument("-c", "--config", help="Config file", required=True)
@@ -137,10 +483,15 @@ def parser():
     return arg_parser
 
 
-def read_stdin() -> Iterable[str]:
-    """Uses TextIOWrapper to yield lines of strings"""
+def read_stdin() -> Iterable[bytes]:
+    """Yields raw lines of bytes from stdin, decoding is left to orjson
 
-    yield from TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    The buffer wraps the unbuffered stdin, so each read returns what's available
+      and lines come out as soon as the tap writes them.
+    """
+
+    reader = io.BufferedReader(sys.stdin.buffer.raw, buffer_size=STDIN_BUFFER_SIZE)
+    yield from iter(reader.readline, b"")
 
 
 def output_state(state: dict | None):
@@ -149,79 +500,239 @@ def output_state(state: dict | None):
     if state is None:
         return
 
-    raw = json.dumps(state)
-    singer.log_debug(f"Outputting State: {raw}")
-    sys.stdout.write(raw + "\n")
-    sys.stdout.flush()
+    raw = orjson.dumps(state)
+    singer.log_debug(f"Outputting State: {raw.decode()}")
+    sys.stdout.buffer.write(raw + b"\n")
+    sys.stdout.buffer.flush()
 
 
-def flatten_record(record: typing.MutableMapping) -> dict:
-    """Recursively flatten records to fit inside a tabular Google Sheet"""
+def schema_properties(schema: Mapping) -> dict:
+    """Properties of an object schema, including those of its `anyOf` / `oneOf`"""
 
-    def items():
-        for key, value in record.items():
-            match value:
-                case typing.MutableMapping:
-                    for sub_key, sub_value in flatten_record(value).items():
-                        yield f"{key}.{sub_key}", sub_value
+    properties = dict(schema.get("properties", {}))
 
-                case _:
-                    yield key, value
+    for branch in (*schema.get("anyOf", ()), *schema.get("oneOf", ())):
+        if isinstance(branch, Mapping):
+            for key, value in schema_properties(branch).items():
+                properties.setdefault(key, value)
 
-    return dict(items())
+    return properties
 
 
-def process_message(msg: singer.Message, data: SingerData) -> dict[str, dict] | None:
-    """Main match statement to parse and understand the Singer messages"""
+def flatten_schema(schema: Mapping) -> tuple[tuple[str, ...], set[str]]:
+    """Flattens the properties of a schema into the columns of `flatten_record`
 
-    match msg:
-        case singer.SchemaMessage():
-            data.schemas[msg.stream] = msg.schema
-            data.key_properties[msg.stream] = msg.key_properties
+    Nested objects with properties are expanded into `.` joined columns, any other
+      property (including free-form objects) is a single column. Returns the
+      columns and the keys of the expanded objects.
+    """
 
-            return None
+    columns, objects = [], set()
+    stack = [("", iter(schema_properties(schema).items()))]
 
-        case singer.StateMessage():
-            singer.log_debug(f"State set to: {msg.value}")
-            state: dict = msg.value
+    while stack:
+        prefix, items = stack[-1]
 
-            return {"state": state}
+        for key, value in items:
+            key = f"{prefix}.{key}" if prefix else key
+            properties = schema_properties(value) if isinstance(value, Mapping) else {}
 
-        case singer.RecordMessage():
-            if msg.stream not in data.schemas:
-                raise SchemaNotFound(
-                    f"Record for stream {msg.stream} was found before the cooresponding schema was recorded"
-                )
+            if properties:
+                objects.add(key)
+                stack.append((key, iter(properties.items())))
+                break
 
-            jsonschema.validate(msg.record, data.schemas[msg.stream])
-            flattened_record = flatten_record(msg.record)
+            columns.append(key)
 
-            return {"record": flattened_record}
+        else:
+            stack.pop()
 
-        case _:
-            raise MessageNotRecognized(
-                f"Message type {type(msg)} not recognized\n{msg}"
+    return tuple(columns), objects
+
+
+def flatten_record(record: Mapping, objects: set[str] | None = None) -> dict:
+    """Flatten nested records to fit inside a tabular Google Sheet
+
+    Nested keys are joined with a `.`, walked with an explicit stack of iterators
+      so the column order matches the order of the original record. If `objects`
+      is given, only those keys are expanded, other nested values are kept whole.
+    """
+
+    flattened = {}
+    stack = [("", iter(record.items()))]
+
+    while stack:
+        prefix, items = stack[-1]
+
+        for key, value in items:
+            key = f"{prefix}.{key}" if prefix else key
+
+            if isinstance(value, Mapping) and (objects is None or key in objects):
+                stack.append((key, iter(value.items())))
+                break
+
+            flattened[key] = value
+
+        else:
+            stack.pop()
+
+    return flattened
+
+
+def parse_message(raw: bytes) -> singer.Message | None:
+    """Parses a raw Singer message using orjson
+
+    Thin replacement for `singer.parse_message`, it builds the singer message objects
+      directly and skips the `time_extracted` parsing which the target doesn't use.
+    Unknown message types return None, same as singer.
+    """
+
+    obj = orjson.loads(raw)
+
+    match obj["type"]:
+        case "RECORD":
+            return singer.RecordMessage(
+                stream=obj["stream"], record=obj["record"], version=obj.get("version")
+            )
+
+        case "SCHEMA":
+            return singer.SchemaMessage(
+                stream=obj["stream"],
+                schema=obj["schema"],
+                key_properties=obj["key_properties"],
+                bookmark_properties=obj.get("bookmark_properties"),
+            )
+
+        case "STATE":
+            return singer.StateMessage(value=obj["value"])
+
+        case "ACTIVATE_VERSION":
+            return singer.ActivateVersionMessage(
+                stream=obj["stream"], version=obj["version"]
             )
 
+        case _:
+            return None
+
+
+def compile_validator(schema: dict) -> Callable[[dict], dict]:
+    """Compiles a record validator for a stream's schema
+
+    Validates like `jsonschema.validate` did: draft-04 unless the schema says
+      otherwise, no `format` checks and no defaults filled into the record.
+    """
+
+    return fastjsonschema.compile(
+        {"$schema": DEFAULT_JSON_SCHEMA, **schema},
+        use_default=False,
+        use_formats=False,
+    )
+
 
-def process_stream(config: TargetGoogleSheetConfig, spreadsheet: gspread.Spreadsheet, message_stream: Iterable[str]):
+def process_schema(msg: singer.SchemaMessage, data: SingerData) -> None:
+    """Records the schema (and its compiled validator) of a stream
+
+    Taps often repeat the same schema, so it's hashed and identical schemas of a
+      stream are skipped instead of being recompiled.
+    """
+
+    data.key_properties[msg.stream] = msg.key_properties
+    schema_hash = hash(orjson.dumps(msg.schema, option=orjson.OPT_SORT_KEYS))
+
+    if data.schema_hashes.get(msg.stream) == schema_hash:
+        return None
+
+    data.schema_hashes[msg.stream] = schema_hash
+    data.schemas[msg.stream] = msg.schema
+
+    columns, objects = flatten_schema(msg.schema)
+    data.objects[msg.stream] = objects if columns else None
+
+    if data.validate_records:
+        data.validators[msg.stream] = compile_validator(msg.schema)
+
+    return None
+
+
+def process_state(msg: singer.StateMessage, data: SingerData) -> dict[str, dict]:
+    """Passes the state of the tap along to be outputted"""
+
+    singer.log_debug(f"State set to: {msg.value}")
+    state: dict = msg.value
+
+    return {"state": state}
+
+
+def process_record(msg: singer.RecordMessage, data: SingerData) -> dict[str, dict]:
+    """Validates (if enabled) and flattens a record of a stream with a known schema"""
+
+    if msg.stream not in data.schemas:
+        raise SchemaNotFound(
+            f"Record for stream {msg.stream} was found before the cooresponding schema was recorded"
+        )
+
+    if data.validate_records:
+        data.validators[msg.stream](msg.record)
+
+    flattened_record = flatten_record(msg.record, data.objects[msg.stream])
+
+    return {"record": flattened_record}
+
+
+#: Singer message type -> handler, used by `process_message`
+MESSAGE_HANDLERS: dict[type, Callable[[singer.Message, SingerData], dict | None]] = {
+    singer.SchemaMessage: process_schema,
+    singer.StateMessage: process_state,
+    singer.RecordMessage: process_record,
+}
+
+
+def process_message(msg: singer.Message, data: SingerData) -> dict[str, dict] | None:
+    """Dispatches the Singer messages to their handler by message type"""
+
+    handler = MESSAGE_HANDLERS.get(type(msg))
+
+    if handler is None:
+        raise MessageNotRecognized(f"Message type {type(msg)} not recognized\n{msg}")
+
+    return handler(msg, data)
+
+
+def process_stream(config: TargetGoogleSheetConfig, spreadsheet: gspread.Spreadsheet, message_stream: Iterable[bytes]):
     """Iteratively processes the messages from the message_stream
 
-    After exhausting stream, drain all
+    Records are buffered per stream and handed to the sink in batches of
+      RECORD_BATCH_SIZE. The latest STATE message is kept pending until a sink
+      overflows, then all sinks are drained and the state is outputted, so it's
+      only emitted once the rows before it are in the sheet.
+    After exhausting stream, drain all and output the pending state
     """
 
     singer_data: SingerData = types.SimpleNamespace(
-        schemas={}, state={}, key_properties={}
+        schemas={},
+        schema_hashes={},
+        objects={},
+        validators={},
+        state={},
+        key_properties={},
+        validate_records=config["validate_records"],
     )
 
     sink = GoogleSheetsSink(config["sink"], spreadsheet)
+    batches: defaultdict[str, list[dict]] = defaultdict(list)
+
+    def flush():
+        for stream, batch in batches.items():
+            if batch:
+                sink.add_many(stream, batch, singer_data.schemas[stream])
+                batch.clear()
 
     state = None
     for raw_msg in message_stream:
         try:
-            msg = singer.parse_message(raw_msg)
-        except json.decoder.JSONDecodeError:
-            singer.log_error("Parsing failed for message:\n {raw}")
+            msg = parse_message(raw_msg)
+        except orjson.JSONDecodeError:
+            singer.log_error(f"Parsing failed for message:\n {raw_msg!r}")
             raise
 
         match process_message(msg, singer_data):
@@ -229,9 +740,26 @@ def process_stream(config: TargetGoogleSheetConfig, spreadsheet: gspread.Spreads
                 ...
 
             case {"record": record}:
-                sink.add(msg.stream, record)
+                batch = batches[msg.stream]
+                batch.append(record)
 
+                if len(batch) < RECORD_BATCH_SIZE:
+                    continue
+
+                drained = sink.add_many(
+                    msg.stream, batch, singer_data.schemas[msg.stream]
+                )
+                batch.clear()
+
+                if drained and state is not None:
+                    flush()
+                    sink.drain_all()
+                    output_state(state)
+                    state = None
+
+    flush()
     sink.drain_all()
+    sink.close()
     output_state(state)
 
 
@@ -250,12 +778,29 @@ def main():
 def get_spreadsheet(url: str, crendentials: Path) -> gspread.Spreadsheet:
     """Gets spreadsheet by url
 
+    All API calls share a single keep-alive session, sized for both the main and
+      the draining thread. Retries are left to `GoogleSheetsSink`.
+
     raises: SpreadsheetNotFound
     """
 
     try:
-        credentials = get_credentials(crendentials)  # can raise error
-        gc = gspread.service_account(credentials)
+        credentials_path = get_credentials(crendentials)  # can raise error
+        credentials = Credentials.from_service_account_file(
+            credentials_path, scopes=gspread.auth.DEFAULT_SCOPES
+        )
+
+        session = AuthorizedSession(credentials)
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=Retry(total=0),
+            ),
+        )
+
+        gc = gspread.Client(auth=credentials, session=session)
         return gc.open_by_url(url)
 
     except gspread.SpreadsheetNotFound:
@@ -282,6 +827,8 @@ def get_config(args):
         ) from None
 
     # TODO: Use Pydantic (defaults)
+    config["validate_records"] = config.get("validate_records", False)
+
     if "sink" not in config:
         config["sink"] = SinkConfig(
             default_sink_size=DEFAULT_SINK_SIZE,
@@ -1,4 +1,4 @@
-from typing import Protocol, TypedDict
+from typing import Callable, Protocol, TypedDict
 
 from typing_extensions import NotRequired
 
@@ -14,6 +14,7 @@ class TargetGoogleSheetConfig(TypedDict):
 
     spreadsheet_url: str
     credentials_path: NotRequired[str]
+    validate_records: NotRequired[bool]
     sink: NotRequired[SinkConfig]
 
 
@@ -21,5 +22,9 @@ class SingerData(Protocol):
     """Simplified representation of singer data"""
 
     schemas: dict
+    schema_hashes: dict[str, int]
+    objects: dict[str, set[str] | None]
+    validators: dict[str, Callable[[dict], dict]]
     key_properties: dict
     state: dict
+    validate_records: bool